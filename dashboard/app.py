@@ -1,7 +1,3 @@
-File name: dashboard/app.py
-
-Paste THIS EXACT CONTENT:
-
 """
 SSIS Compliance Dashboard - Web Interface
 Simple Flask app for business users
@@ -9,8 +5,21 @@ Simple Flask app for business users
 
 from flask import Flask, render_template, request, jsonify
 from ssis_analyzer import SSISAnalyzer
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 import json
+import multiprocessing
 import os
+import threading
+import time
+import uuid
+
+try:
+    import orjson  # faster JSON encoding for large violation lists
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
@@ -47,6 +56,90 @@ COMPLIANCE_TEMPLATES = {
     }
 }
 
+# Each cached analyzer keeps its own result cache, so per process at most
+# ANALYZER_CACHE_SIZE * RESULT_CACHE_SIZE results are held
+ANALYZER_CACHE_SIZE = 128
+RESULT_CACHE_SIZE = 32
+
+@lru_cache(maxsize=ANALYZER_CACHE_SIZE)
+def _get_analyzer(axioms_tuple, threshold):
+    """Return a shared analyzer for an axiom set, building it on first use"""
+    return SSISAnalyzer(list(axioms_tuple), {
+        'threshold': threshold,
+        'result_cache_size': RESULT_CACHE_SIZE
+    })
+
+# Prebuild the template analyzers so the first request is already warm
+for _template in COMPLIANCE_TEMPLATES.values():
+    _get_analyzer(tuple(_template['axioms']), _template['threshold'])
+
+# Policies at least this long are answered with a job id to poll instead of
+# blocking the request until the result is ready
+ASYNC_POLICY_CHARS = 4096
+
+# Process pool for analyses, created on first use by _submit_analysis
+EXECUTOR = None
+
+# Jobs not collected within this many seconds are dropped, and at most
+# MAX_JOBS are tracked at once, so unpolled results cannot pile up
+JOB_TTL_SECONDS = 600
+MAX_JOBS = 1024
+
+JOBS = OrderedDict()  # job id -> (Future, submit time), oldest first
+JOBS_LOCK = threading.Lock()
+
+def _evict_expired_jobs():
+    """Forget jobs submitted more than JOB_TTL_SECONDS ago (caller holds JOBS_LOCK)"""
+    cutoff = time.monotonic() - JOB_TTL_SECONDS
+    while JOBS:
+        job_id, (future, submitted) = next(iter(JOBS.items()))
+        if submitted > cutoff:
+            break
+        future.cancel()
+        del JOBS[job_id]
+
+def _new_executor():
+    """
+    Create the analysis pool. Processes come from a forkserver rather than a
+    plain fork of this (multi-threaded) process, so they never inherit a lock
+    held mid-request; platforms without forkserver (Windows) use spawn.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+
+def _submit_analysis(*args):
+    """Submit _analyze_job(*args) to the pool (caller holds JOBS_LOCK)"""
+    global EXECUTOR
+    if EXECUTOR is None:
+        EXECUTOR = _new_executor()
+    
+    try:
+        return EXECUTOR.submit(_analyze_job, *args)
+    except BrokenProcessPool:
+        # A pool process died (e.g. OOM-killed); replace the pool and retry once
+        EXECUTOR.shutdown(wait=False)
+        EXECUTOR = _new_executor()
+        return EXECUTOR.submit(_analyze_job, *args)
+
+def _analyze_job(axioms_tuple, threshold, policy, template_name=None):
+    """Run one analysis; module-level so the process pool can pickle it"""
+    results = _get_analyzer(axioms_tuple, threshold).analyze_policy(policy)
+    if template_name:
+        results['template'] = template_name
+    return results
+
+def _json_response(payload):
+    """Serialize payload as a JSON response, using orjson when available"""
+    if orjson is None:
+        return jsonify(payload)
+    try:
+        body = orjson.dumps(payload)
+    except TypeError:
+        # orjson rejects what stdlib json accepts, e.g. lone surrogates
+        return jsonify(payload)
+    return app.response_class(body, mimetype='application/json')
+
 @app.route('/')
 def index():
     return render_template('index.html', templates=COMPLIANCE_TEMPLATES)
@@ -59,17 +152,61 @@ def analyze():
         template = COMPLIANCE_TEMPLATES[data['template']]
         axioms = template['axioms']
         threshold = template['threshold']
+        template_name = template['name']
     else:
         axioms = data['axioms']
         threshold = data.get('threshold', 0.3)
+        template_name = None
     
-    analyzer = SSISAnalyzer(axioms, {'threshold': threshold})
-    results = analyzer.analyze_policy(data['policy'])
+    policy = data['policy']
     
-    if data.get('template'):
-        results['template'] = COMPLIANCE_TEMPLATES[data['template']]['name']
+    # Short policies get a synchronous reply, but still run in the pool so
+    # concurrent requests use every core instead of this process's GIL
+    if len(policy) < ASYNC_POLICY_CHARS:
+        try:
+            with JOBS_LOCK:
+                future = _submit_analysis(tuple(axioms), threshold, policy, template_name)
+            return _json_response(future.result())
+        except BrokenProcessPool as error:
+            return _json_response({'error': f"Analysis failed: {error}"}), 503
+    
+    with JOBS_LOCK:
+        _evict_expired_jobs()
+        if len(JOBS) >= MAX_JOBS:
+            return _json_response({'error': "Too many pending analyses, retry later"}), 503
+        
+        try:
+            future = _submit_analysis(tuple(axioms), threshold, policy, template_name)
+        except BrokenProcessPool:
+            return _json_response({'error': "Analysis pool unavailable, retry later"}), 503
+        
+        job_id = uuid.uuid4().hex
+        JOBS[job_id] = (future, time.monotonic())
+    
+    return _json_response({'job_id': job_id, 'status': 'pending'}), 202
+
+@app.route('/result/<job_id>')
+def result(job_id):
+    with JOBS_LOCK:
+        _evict_expired_jobs()
+        job = JOBS.get(job_id)
+        if job is not None and job[0].done():
+            # Collected under the lock, so concurrent polls cannot both take it
+            job = JOBS.pop(job_id, None)
+    
+    if job is None:
+        return _json_response({'error': f"Unknown job: {job_id}"}), 404
+    
+    future = job[0]
+    if not future.done():
+        return _json_response({'job_id': job_id, 'status': 'pending'}), 202
+    
+    error = future.exception()
+    if error is not None:
+        return _json_response({'job_id': job_id, 'status': 'failed', 'error': f"Analysis failed: {error}"}), 500
     
-    return jsonify(results)
+    return _json_response(future.result())
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Development server only; use gunicorn_conf.py for deployments
+    app.run(port=5000)
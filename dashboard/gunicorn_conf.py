@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the SSIS Compliance Dashboard
+
+Run from the dashboard directory:
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import multiprocessing
+
+bind = '127.0.0.1:5000'
+
+# Every analysis runs in app.EXECUTOR's process pool (one process per core),
+# so CPU-bound work scales across cores from a single worker. Threads only
+# wait on the pool: small policies block on their result, large ones return
+# a job id. Job ids only resolve in the worker that created them, hence one
+# worker; twice as many threads as cores keeps the pool saturated.
+workers = 1
+worker_class = 'gthread'
+threads = multiprocessing.cpu_count() * 2
+
+# Import the app (and prebuild template analyzers) once in the master;
+# the worker inherits the warm analyzer cache (pool processes start from a
+# forkserver or spawn and build their own on first use)
+preload_app = True
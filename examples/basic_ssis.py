@@ -5,26 +5,117 @@ Version 1.1 - Complete with real demonstrations
 A working AI governance tool that detects policy violations against core principles.
 """
 
+import hashlib
 import json
 import re
-from typing import List, Dict, Any
+import sys
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, AbstractSet, FrozenSet, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-term matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # faster JSON encoding for reports
+except ImportError:
+    orjson = None
+
 @dataclass
 class Violation:
     """Structure for detected violations"""
+    __slots__ = ('axiom', 'reason', 'severity', 'location', 'suggestion')
+    
     axiom: str
     reason: str
     severity: float  # 0.0 to 1.0
     location: str   # Where in text violation was found
     suggestion: str # How to fix it
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a plain dict (slotted instances have no __dict__)"""
+        return {
+            'axiom': self.axiom,
+            'reason': self.reason,
+            'severity': self.severity,
+            'location': self.location,
+            'suggestion': self.suggestion
+        }
+
+# Optimization goals that may conflict with protective principles
+# e.g., "optimize profit" vs "prioritize safety". Tuples rather than
+# frozensets: the first phrase of each side names the pair in reports.
+_CONTRADICTION_PAIRS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (('optimize profit', 'maximize revenue', 'reduce costs'),
+     ('prioritize safety', 'ensure wellbeing', 'protect users')),
+    (('efficiency', 'speed', 'performance'),
+     ('thoroughness', 'accuracy', 'reliability')),
+    (('collect data', 'analyze behavior', 'track users'),
+     ('respect privacy', 'minimize data', 'anonymous'))
+)
+
+# Constraint keyword followed by the phrase it governs, up to the end of the clause.
+# "must not" precedes "must" so a prohibition is never also read as a requirement.
+_CONSTRAINT_RE = re.compile(
+    r'\b(must not|must|prohibit|forbid|ban|require|ensure|guarantee)\b([^.;:!?\n]*)'
+)
+
+# Pattern bucket each constraint keyword fills
+_CONSTRAINT_BUCKETS = {
+    'must not': 'must_not_patterns',
+    'must': 'must_patterns',
+    'prohibit': 'prohibited_patterns',
+    'forbid': 'prohibited_patterns',
+    'ban': 'prohibited_patterns',
+    'require': 'required_patterns',
+    'ensure': 'required_patterns',
+    'guarantee': 'required_patterns',
+}
+
+# Policies are lowercased and scanned this many characters (rounded up to a
+# whole line) at a time, so no full lowercase copy is ever held
+_SCAN_CHUNK_CHARS = 1 << 16
+
+# Severity above which a violation counts as critical
+CRITICAL_SEVERITY = 0.7
+
+def _iter_line_chunks(text: str) -> Iterator[Tuple[int, str]]:
+    """Yield (first line number, chunk) pieces of text split at line boundaries"""
+    start = 0
+    line_number = 0
+    while start < len(text):
+        end = text.find('\n', start + _SCAN_CHUNK_CHARS)
+        if end == -1:
+            end = len(text)
+        chunk = text[start:end]
+        yield line_number, chunk
+        line_number += chunk.count('\n') + 1
+        start = end + 1
+
+def _score_kernel(severities: List[float], n_axioms: int) -> Tuple[float, float, int]:
+    """Aggregate violation severities into (total_score, severity_score, critical_count)"""
+    critical = sum(severity > CRITICAL_SEVERITY for severity in severities)
+    if not n_axioms:
+        return 0.0, 0.0, critical
+    return len(severities) / n_axioms, sum(severities) / n_axioms, critical
 
 class SSISAnalyzer:
     """
     Main SSIS analyzer class with expanded detection capabilities
     """
     
+    # Synonyms and related terms (basic expansion)
+    SYNONYM_MAP = {
+        'deceive': ['lie', 'mislead', 'false', 'dishonest'],
+        'harm': ['hurt', 'damage', 'injure', 'danger'],
+        'privacy': ['confidential', 'personal data', 'information'],
+        'discriminate': ['bias', 'unfair', 'prejudice', 'favoritism']
+    }
+    
     def __init__(self, axioms: List[str], config: Dict[str, Any] = None):
         """
         Initialize with sovereign axioms and configuration
@@ -33,52 +124,146 @@ class SSISAnalyzer:
             axioms: List of sovereign principles to enforce
             config: Analysis configuration
         """
-        self.axioms = axioms
-        self.config = config or {
+        # Own copy: per-axiom pattern lists below are indexed in step with it
+        self.axioms = list(axioms)
+        self.config = {
             'threshold': 0.3,  # 30% violation threshold
             'enable_semantic': True,
-            'strict_mode': False
+            'strict_mode': False,
+            'result_cache_size': 256,  # Recent policies kept for repeat analysis (0 disables)
+            'result_cache_min_chars': 4096,  # Shorter policies are cheaper to re-analyze than to cache
+            **(config or {})
         }
         
         # Build detection patterns from axioms
-        self.patterns = self._build_detection_patterns(axioms)
+        self._build_detection_patterns(axioms)
+        
+        # Every term a policy is tested for, matched in one pass per analysis
+        self._terms = set().union(*self._term_unions)
+        self._automaton = self._build_automaton(self._terms)
+        # Prohibited phrases, whose first line is reported as the violation location
+        self._located_terms = frozenset(
+            phrase for phrases in self._must_not_patterns for phrase in phrases
+        )
         
-    def _build_detection_patterns(self, axioms: List[str]) -> List[Dict]:
-        """Convert axioms to detection patterns"""
-        patterns = []
+        # Results of recent analyses, keyed by config and policy digest
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+    def _build_detection_patterns(self, axioms: List[str]) -> None:
+        """
+        Convert axioms to detection patterns, stored as parallel lists
+        indexed like self.axioms so analysis walks each field in order
+        """
+        self._must_patterns = []
+        self._must_not_patterns = []
+        self._prohibited_patterns = []
+        self._required_patterns = []
+        self._must_tokens = []
+        self._must_not_tokens = []
+        self._contradiction_masks = []
+        self._term_unions = []
         
         for axiom in axioms:
             axiom_lower = axiom.lower()
+            constraints = {
+                'must_patterns': [],
+                'must_not_patterns': [],
+                'prohibited_patterns': [],
+                'required_patterns': [],
+            }
+            
+            # Extract key constraints from axiom language in a single regex pass
+            for match in _CONSTRAINT_RE.finditer(axiom_lower):
+                # Any whitespace (\r, NBSP, ...) and stray commas around the phrase
+                constraint = match.group(2).strip().strip(',').strip()
+                if constraint:
+                    constraints[_CONSTRAINT_BUCKETS[match.group(1)]].append(constraint)
             
-            # Extract key constraints from axiom language
-            patterns.append({
-                'axiom': axiom,
-                'must_patterns': self._extract_constraints(axiom_lower, 'must'),
-                'must_not_patterns': self._extract_constraints(axiom_lower, 'must not'),
-                'prohibited_patterns': self._extract_constraints(axiom_lower, ['prohibit', 'forbid', 'ban']),
-                'required_patterns': self._extract_constraints(axiom_lower, ['require', 'ensure', 'guarantee']),
-            })
+            # Pre-tokenized so analyze_policy never re-splits constraints
+            must_tokens = [frozenset(c.split()) for c in constraints['must_patterns']]
+            must_not_tokens = [frozenset(c.split()) for c in constraints['must_not_patterns']]
+            # Bit j set when the axiom requires a positive of _CONTRADICTION_PAIRS[j]
+            contradiction_mask = 0
+            for j, (_, positives) in enumerate(_CONTRADICTION_PAIRS):
+                if any(p in axiom_lower for p in positives):
+                    contradiction_mask |= 1 << j
             
-        return patterns
+            self._must_patterns.append(constraints['must_patterns'])
+            self._must_not_patterns.append(constraints['must_not_patterns'])
+            self._prohibited_patterns.append(constraints['prohibited_patterns'])
+            self._required_patterns.append(constraints['required_patterns'])
+            self._must_tokens.append(must_tokens)
+            self._must_not_tokens.append(must_not_tokens)
+            self._contradiction_masks.append(contradiction_mask)
+            self._term_unions.append(self._pattern_terms(
+                constraints['must_not_patterns'], must_tokens + must_not_tokens, contradiction_mask
+            ))
+    
+    def _pattern_terms(self, must_not_patterns: List[str], tokens_list: List[FrozenSet[str]],
+                       contradiction_mask: int) -> FrozenSet[str]:
+        """Gather an axiom's constraint words, their synonyms, contradiction
+        negatives and the prohibited phrases whose location is reported"""
+        terms = set(must_not_patterns)
+        
+        for tokens in tokens_list:
+            for word in tokens:
+                terms.add(word)
+                terms.update(self.SYNONYM_MAP.get(word, ()))
+        for j, (negatives, _) in enumerate(_CONTRADICTION_PAIRS):
+            if contradiction_mask >> j & 1:
+                terms.update(negatives)
+        
+        return frozenset(terms)
     
-    def _extract_constraints(self, text: str, constraint_words) -> List[str]:
-        """Extract what is being constrained from axiom text"""
-        if isinstance(constraint_words, str):
-            constraint_words = [constraint_words]
+    def _build_automaton(self, terms: Set[str]):
+        """Build an Aho-Corasick automaton over terms (None if unavailable)"""
+        if ahocorasick is None or not terms:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return automaton
+    
+    def _iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (offset, term) for known terms occurring in lowercase text"""
+        if self._automaton is None:
+            for term in self._terms:
+                offset = text.find(term)
+                if offset != -1:
+                    yield offset, term
+            return
+        
+        for end, term in self._automaton.iter(text):
+            yield end - len(term) + 1, term
+    
+    def _scan_terms(self, text: str) -> Dict[str, Optional[Tuple[int, str]]]:
+        """
+        Map each known term occurring in text (case-insensitively) to its first
+        (line index, line) for located terms, or None for all other terms
+        """
+        found = {}
+        
+        # Terms never span lines, so lowercasing chunks of whole lines matches
+        # exactly what scanning one lowercased copy of the policy would
+        for first_line, chunk in _iter_line_chunks(text):
+            chunk_lower = chunk.lower()
+            chunk_lines = None
             
-        constraints = []
-        for word in constraint_words:
-            if word in text:
-                # Extract the part after constraint word
-                parts = text.split(word, 1)
-                if len(parts) > 1:
-                    constraint = parts[1].strip()
-                    # Clean up punctuation
-                    constraint = re.sub(r'[.,;:!?]$', '', constraint)
-                    if constraint:
-                        constraints.append(constraint)
+            for offset, term in self._iter_matches(chunk_lower):
+                if term in found:
+                    continue
+                location = None
+                if term in self._located_terms:
+                    if chunk_lines is None:
+                        chunk_lines = chunk.split('\n')
+                    i = chunk_lower.count('\n', 0, offset)
+                    location = (first_line + i, chunk_lines[i])
+                found[term] = location
         
-        return constraints
+        return found
     
     def analyze_policy(self, policy_text: str, context: str = "") -> Dict[str, Any]:
         """
@@ -91,27 +276,85 @@ class SSISAnalyzer:
         Returns:
             Detailed analysis with violations and scores
         """
-        policy_lower = policy_text.lower()
+        cache_size = self.config['result_cache_size']
+        if not cache_size or len(policy_text) < self.config['result_cache_min_chars']:
+            return self._analyze(policy_text)
+        
+        # Patterns are fixed at init, so a result depends only on the policy
+        # and the config options that analysis reads
+        key = (
+            self.config['threshold'],
+            self.config['enable_semantic'],
+            self._policy_digest(policy_text)
+        )
+        
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        
+        if cached is not None:
+            results = self._copy_results(cached)
+            results['timestamp'] = datetime.now().isoformat()
+            return results
+        
+        results = self._analyze(policy_text)
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = self._copy_results(results)
+            while len(self._result_cache) > cache_size:
+                self._result_cache.popitem(last=False)
+        
+        return results
+    
+    def _policy_digest(self, policy_text: str) -> bytes:
+        """
+        BLAKE2b digest of a policy, encoded in chunks so no full-size byte copy
+        is built; surrogatepass accepts lone surrogates that JSON input can carry
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for start in range(0, len(policy_text), _SCAN_CHUNK_CHARS):
+            chunk = policy_text[start:start + _SCAN_CHUNK_CHARS]
+            digest.update(chunk.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+    
+    def _copy_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the mutable parts of a result so caller edits never reach the cache"""
+        return {
+            **results,
+            'violations': [dict(v) for v in results['violations']],
+            'recommendations': list(results['recommendations'])
+        }
+    
+    def _analyze(self, policy_text: str) -> Dict[str, Any]:
+        """Run the full analysis of analyze_policy without consulting the cache"""
+        found = self._scan_terms(policy_text)
+        hits = found.keys()
+        triggered = self._triggered_contradictions(hits)
         violations = []
         
         # Check each axiom pattern
-        for pattern in self.patterns:
-            axiom = pattern['axiom']
+        for i in range(len(self._term_unions)):
+            axiom = self.axioms[i]
+            
+            # If none of the axiom's terms occur, nothing prohibited or contradictory
+            # can be present and every required action is missing
+            matched = not hits.isdisjoint(self._term_unions[i])
             
             # Check for must_not violations (prohibited actions)
-            for prohibited in pattern['must_not_patterns']:
-                if self._contains_action(policy_lower, prohibited):
+            for prohibited, tokens in zip(self._must_not_patterns[i], self._must_not_tokens[i]):
+                if matched and self._contains_action(hits, tokens):
                     violations.append(Violation(
                         axiom=axiom,
                         reason=f"Policy allows or enables: {prohibited}",
                         severity=0.8,
-                        location=self._find_location(policy_text, prohibited),
+                        location=self._find_location(found.get(prohibited)),
                         suggestion=f"Remove or restrict references to: {prohibited}"
                     ))
             
             # Check for must violations (required actions missing)
-            for required in pattern['must_patterns']:
-                if not self._contains_action(policy_lower, required):
+            for required, tokens in zip(self._must_patterns[i], self._must_tokens[i]):
+                if not matched or not self._contains_action(hits, tokens):
                     violations.append(Violation(
                         axiom=axiom,
                         reason=f"Policy does not ensure: {required}",
@@ -121,77 +364,64 @@ class SSISAnalyzer:
                     ))
             
             # Check semantic contradictions (more advanced)
-            if self.config['enable_semantic']:
-                semantic_violations = self._check_semantic_contradictions(
-                    axiom, policy_text, pattern
-                )
+            if matched and self.config['enable_semantic']:
+                semantic_violations = self._check_semantic_contradictions(i, triggered)
                 violations.extend(semantic_violations)
         
-        # Calculate scores
-        total_score = len(violations) / len(self.axioms) if self.axioms else 0
-        
-        # Weight by severity
-        severity_score = sum(v.violation for v in violations) / len(self.axioms) if violations else 0
+        # Calculate scores, weighting by severity
+        severities = [v.severity for v in violations]
+        total_score, severity_score, critical = _score_kernel(severities, len(self.axioms))
         
         return {
             'timestamp': datetime.now().isoformat(),
             'policy_preview': policy_text[:200] + ("..." if len(policy_text) > 200 else ""),
             'axioms_checked': len(self.axioms),
             'total_violations': len(violations),
+            'critical_violations': critical,
             'compliance_score': 1.0 - total_score,  # Higher = more compliant
             'severity_score': severity_score,
             'is_compliant': total_score < self.config['threshold'],
-            'violations': [vars(v) for v in violations],
+            'violations': [v.to_dict() for v in violations],
             'recommendations': self._generate_recommendations(violations),
             'risk_level': self._assess_risk_level(total_score, severity_score)
         }
     
-    def _contains_action(self, text: str, action: str) -> bool:
-        """Check if text contains or enables an action"""
+    def _contains_action(self, hits: AbstractSet[str], action_words: FrozenSet[str]) -> bool:
+        """Check if the scanned terms contain or enable an action (given as pre-split words)"""
         # Simple keyword matching (expand with NLP in future)
-        action_words = action.split()
-        
         # Check for direct mentions
-        if all(word in text for word in action_words):
+        if action_words <= hits:
             return True
             
-        # Check for synonyms and related terms (basic expansion)
-        synonym_map = {
-            'deceive': ['lie', 'mislead', 'false', 'dishonest'],
-            'harm': ['hurt', 'damage', 'injure', 'danger'],
-            'privacy': ['confidential', 'personal data', 'information'],
-            'discriminate': ['bias', 'unfair', 'prejudice', 'favoritism']
-        }
-        
+        # Check for synonyms and related terms
         for word in action_words:
-            if word in synonym_map:
-                for synonym in synonym_map[word]:
-                    if synonym in text:
-                        return True
+            for synonym in self.SYNONYM_MAP.get(word, ()):
+                if synonym in hits:
+                    return True
         
         return False
     
-    def _check_semantic_contradictions(self, axiom: str, policy: str, pattern: Dict) -> List[Violation]:
-        """Check for semantic contradictions (beyond keyword matching)"""
+    def _triggered_contradictions(self, hits: AbstractSet[str]) -> int:
+        """Bitmask of contradiction pairs whose negatives occur in the policy"""
+        triggered = 0
+        for j, (negatives, _) in enumerate(_CONTRADICTION_PAIRS):
+            if not hits.isdisjoint(negatives):
+                triggered |= 1 << j
+        return triggered
+    
+    def _check_semantic_contradictions(self, axiom_idx: int, triggered: int) -> List[Violation]:
+        """Check the axiom at axiom_idx for semantic contradictions (beyond keyword matching)"""
         violations = []
-        policy_lower = policy.lower()
+        axiom = self.axioms[axiom_idx]
         
-        # Check for optimization contradictions
-        # e.g., "optimize profit" vs "prioritize safety"
-        contradiction_pairs = [
-            (['optimize profit', 'maximize revenue', 'reduce costs'], 
-             ['prioritize safety', 'ensure wellbeing', 'protect users']),
-            (['efficiency', 'speed', 'performance'],
-             ['thoroughness', 'accuracy', 'reliability']),
-            (['collect data', 'analyze behavior', 'track users'],
-             ['respect privacy', 'minimize data', 'anonymous'])
-        ]
+        # A pair fires when the policy mentions a negative (triggered, per policy)
+        # and the axiom requires a positive (mask, per axiom at init)
+        active = self._contradiction_masks[axiom_idx] & triggered
+        if not active:
+            return violations
         
-        for negatives, positives in contradiction_pairs:
-            negative_in_policy = any(n in policy_lower for n in negatives)
-            positive_required = any(p in axiom.lower() for p in positives)
-            
-            if negative_in_policy and positive_required:
+        for j, (negatives, positives) in enumerate(_CONTRADICTION_PAIRS):
+            if active >> j & 1:
                 violations.append(Violation(
                     axiom=axiom,
                     reason=f"Policy emphasizes {negatives[0]} which may conflict with {positives[0]}",
@@ -202,23 +432,17 @@ class SSISAnalyzer:
         
         return violations
     
-    def _find_location(self, text: str, search_term: str) -> str:
-        """Find where in text a term appears"""
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if search_term.lower() in line.lower():
-                return f"Line {i+1}: {line.strip()[:50]}..."
-        return "Policy scope"
+    def _find_location(self, location: Optional[Tuple[int, str]]) -> str:
+        """Describe the line where a term was first found"""
+        if location is None:
+            return "Policy scope"
+        i, line = location
+        return f"Line {i+1}: {line.strip()[:50]}..."
     
     def _generate_recommendations(self, violations: List[Violation]) -> List[str]:
         """Generate actionable recommendations from violations"""
-        recs = []
-        seen = set()
-        
-        for violation in violations:
-            if violation.suggestion not in seen:
-                recs.append(violation.suggestion)
-                seen.add(violation.suggestion)
+        # Unique suggestions in first-seen order (dicts preserve insertion order)
+        recs = list(dict.fromkeys(v.suggestion for v in violations))
         
         # Add general recommendations if many violations
         if len(violations) > len(self.axioms) * 0.5:
@@ -238,11 +462,21 @@ class SSISAnalyzer:
         else:
             return "CRITICAL"
 
+def _dumps_indented(data: Dict) -> str:
+    """Serialize data as indented JSON, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. lone surrogates, which stdlib json escapes
+    return json.dumps(data, indent=2)
+
 def demo_healthcare_compliance():
     """Demo: Healthcare AI compliance check"""
-    print("\n" + "="*60)
-    print("DEMO 1: Healthcare AI Compliance Audit")
-    print("="*60)
+    out = []
+    out.append("\n" + "="*60)
+    out.append("DEMO 1: Healthcare AI Compliance Audit")
+    out.append("="*60)
     
     healthcare_axioms = [
         "AI must prioritize patient well-being above all else",
@@ -274,24 +508,28 @@ def demo_healthcare_compliance():
     analyzer = SSISAnalyzer(healthcare_axioms)
     results = analyzer.analyze_policy(problematic_policy, "Healthcare AI policy")
     
-    print(f"Axioms Checked: {results['axioms_checked']}")
-    print(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
-    print(f"Risk Level: {results['risk_level']}")
-    print(f"Violations Found: {results['total_violations']}")
+    out.append(f"Axioms Checked: {results['axioms_checked']}")
+    out.append(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
+    out.append(f"Risk Level: {results['risk_level']}")
+    out.append(f"Violations Found: {results['total_violations']}")
     
     if results['violations']:
-        print("\nTOP VIOLATIONS:")
+        out.append("\nTOP VIOLATIONS:")
         for i, violation in enumerate(results['violations'][:3], 1):
-            print(f"{i}. {violation['reason']}")
-            print(f"   Suggestion: {violation['suggestion']}")
+            out.append(f"{i}. {violation['reason']}")
+            out.append(f"   Suggestion: {violation['suggestion']}")
+    
+    out.append(f"\nOverall: {'COMPLIANT' if results['is_compliant'] else 'NON-COMPLIANT'}")
     
-    print(f"\nOverall: {'COMPLIANT' if results['is_compliant'] else 'NON-COMPLIANT'}")
+    # One write for the whole report instead of a syscall per line
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def demo_gdpr_compliance():
     """Demo: GDPR compliance audit for AI systems"""
-    print("\n" + "="*60)
-    print("DEMO 2: GDPR Compliance Audit for AI Systems")
-    print("="*60)
+    out = []
+    out.append("\n" + "="*60)
+    out.append("DEMO 2: GDPR Compliance Audit for AI Systems")
+    out.append("="*60)
     
     gdpr_axioms = [
         "Must obtain explicit user consent for data processing",
@@ -328,26 +566,29 @@ def demo_gdpr_compliance():
     analyzer = SSISAnalyzer(gdpr_axioms, {'threshold': 0.2})  # Stricter for GDPR
     results = analyzer.analyze_policy(startup_policy, "Startup AI data policy")
     
-    print(f"GDPR Principles Checked: {results['axioms_checked']}")
-    print(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
-    print(f"Risk Level: {results['risk_level']}")
-    print(f"Violations Found: {results['total_violations']}")
+    out.append(f"GDPR Principles Checked: {results['axioms_checked']}")
+    out.append(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
+    out.append(f"Risk Level: {results['risk_level']}")
+    out.append(f"Violations Found: {results['total_violations']}")
     
     if results['violations']:
-        print("\nCRITICAL VIOLATIONS:")
+        out.append("\nCRITICAL VIOLATIONS:")
         for i, violation in enumerate(results['violations'], 1):
-            print(f"{i}. {violation['reason']}")
-            print(f"   Severity: {violation['severity']:.1f}/1.0")
+            out.append(f"{i}. {violation['reason']}")
+            out.append(f"   Severity: {violation['severity']:.1f}/1.0")
     
-    print(f"\nRecommendations:")
+    out.append(f"\nRecommendations:")
     for i, rec in enumerate(results['recommendations'][:3], 1):
-        print(f"{i}. {rec}")
+        out.append(f"{i}. {rec}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def demo_financial_ethics():
     """Demo: Financial AI ethics compliance"""
-    print("\n" + "="*60)
-    print("DEMO 3: Financial AI Ethics Audit")
-    print("="*60)
+    out = []
+    out.append("\n" + "="*60)
+    out.append("DEMO 3: Financial AI Ethics Audit")
+    out.append("="*60)
     
     finance_axioms = [
         "AI must not engage in market manipulation",
@@ -380,9 +621,9 @@ def demo_financial_ethics():
     analyzer = SSISAnalyzer(finance_axioms)
     results = analyzer.analyze_policy(fintech_policy, "Fintech AI policy")
     
-    print(f"Financial Ethics Principles: {results['axioms_checked']}")
-    print(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
-    print(f"Risk Level: {results['risk_level']}")
+    out.append(f"Financial Ethics Principles: {results['axioms_checked']}")
+    out.append(f"Compliance Score: {results['compliance_score']:.2f}/1.0")
+    out.append(f"Risk Level: {results['risk_level']}")
     
     # Generate compliance report
     report = {
@@ -392,13 +633,15 @@ def demo_financial_ethics():
             'score': results['compliance_score'],
             'status': 'COMPLIANT' if results['is_compliant'] else 'NON-COMPLIANT',
             'risk': results['risk_level'],
-            'critical_issues': len([v for v in results['violations'] if v['severity'] > 0.7])
+            'critical_issues': results['critical_violations']
         },
         'action_items': results['recommendations']
     }
     
-    print(f"\nAUDIT REPORT SUMMARY:")
-    print(json.dumps(report, indent=2))
+    out.append(f"\nAUDIT REPORT SUMMARY:")
+    out.append(_dumps_indented(report))
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def interactive_demo():
     """Interactive demo for users to test their own policies"""
@@ -478,8 +721,8 @@ def interactive_demo():
 
 def export_compliance_report(results: Dict, filename: str = "ssis_report.json"):
     """Export results to JSON report"""
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(_dumps_indented(results))
     print(f"\nReport exported to: {filename}")
 
 def main():